@@ -4,6 +4,8 @@
 #include <QApplication>
 #include <QAction>
 #include <QMessageBox>
+#include <QDebug>
+#include <QFile>
 
 MainWindow::MainWindow(QWidget *parent)
     : QMainWindow(parent), client_(new StarlinkClient(this))
@@ -11,18 +13,22 @@ MainWindow::MainWindow(QWidget *parent)
     createUi();
     createTrayIcon();
 
+    // Load icons before the first poll can report a status
+    const QString connectedPath = ":/icons/connected.png";
+    const QString disconnectedPath = ":/icons/disconnected.png";
+    if (!QFile::exists(connectedPath) || !QFile::exists(disconnectedPath))
+        qWarning() << "Tray icons missing from resources";
+    connectedIcon_ = QIcon(connectedPath);
+    disconnectedIcon_ = QIcon(disconnectedPath);
+
+    updateStatus(false); // Initial state, replaced by the first poll result
+
     connect(client_, &StarlinkClient::statusChanged, this, &MainWindow::updateStatus);
     connect(client_, &StarlinkClient::speedUpdated, this, &MainWindow::updateSpeed);
     connect(client_, &StarlinkClient::locationUpdated, this, &MainWindow::updateLocation);
     connect(client_, &StarlinkClient::satelliteInfoUpdated, this, &MainWindow::updateSatelliteInfo);
 
     client_->startMonitoring();
-    
-    // Load icons (placeholders for now, will be replaced by generated images)
-    connectedIcon_ = QIcon(":/icons/connected.png");
-    disconnectedIcon_ = QIcon(":/icons/disconnected.png");
-    
-    updateStatus(false); // Initial state
 }
 
 MainWindow::~MainWindow()
@@ -91,6 +97,12 @@ void MainWindow::onTrayIconActivated(QSystemTrayIcon::ActivationReason reason)
 
 void MainWindow::updateStatus(bool connected)
 {
+    // The client reports status on every poll; only touch the tray when it
+    // actually changes, since some tray backends redraw on every setIcon().
+    if (lastConnected_ == connected)
+        return;
+    lastConnected_ = connected;
+
     if (connected) {
         statusLabel_->setText("Status: Connected");
         trayIcon_->setIcon(connectedIcon_);
@@ -5,6 +5,7 @@
 #include <QSystemTrayIcon>
 #include <QLabel>
 #include <QMenu>
+#include <optional>
 #include "starlinkclient.h"
 
 class MainWindow : public QMainWindow
@@ -40,6 +41,7 @@ private:
     
     QIcon connectedIcon_;
     QIcon disconnectedIcon_;
+    std::optional<bool> lastConnected_;
 };
 
 #endif // MAINWINDOW_H
@@ -8,6 +8,13 @@ using grpc::Channel;
 using grpc::ClientContext;
 using grpc::Status;
 
+namespace {
+constexpr qint64 kLocationRefreshMs = 60 * 60 * 1000;
+constexpr qint64 kLocationRetryMs = 5 * 60 * 1000;
+constexpr int kMinPollIntervalMs = 5000;
+constexpr int kMaxPollIntervalMs = 5 * 60 * 1000;
+}
+
 StarlinkClient::StarlinkClient(const QString &target, QObject *parent)
     : QObject(parent), target_(target)
 {
@@ -26,7 +33,8 @@ StarlinkClient::~StarlinkClient()
 
 void StarlinkClient::startMonitoring()
 {
-    pollTimer_->start(5000); // Poll every 5 seconds
+    lastConnected_.reset(); // Don't back off from a previous session's state
+    pollTimer_->start(kMinPollIntervalMs); // Backs off while state is stable
     fetchStatus(); // Initial fetch
 }
 
@@ -37,6 +45,8 @@ void StarlinkClient::stopMonitoring()
 
 void StarlinkClient::fetchStatus()
 {
+    bool connected = false;
+
     // 1. Get Status
     {
         ClientContext context;
@@ -47,7 +57,8 @@ void StarlinkClient::fetchStatus()
 
         Status status = stub_->Handle(&context, request, &response);
 
-        if (status.ok()) {
+        connected = status.ok();
+        if (connected) {
             emit statusChanged(true);
             
             // Parse device info if available
@@ -65,7 +76,10 @@ void StarlinkClient::fetchStatus()
     }
 
     // 2. Get Location
-    {
+    // Request is a oneof, so this can't share a round-trip with GetStatus.
+    // The dish rarely moves, so only re-query it once an hour. Dishes without
+    // location access enabled reject the call; retry those less often too.
+    if (!locationTimer_.isValid() || locationTimer_.hasExpired(locationRefreshMs_)) {
         ClientContext context;
         SpaceX::API::Device::Request request;
         SpaceX::API::Device::Response response;
@@ -74,9 +88,13 @@ void StarlinkClient::fetchStatus()
 
         Status status = stub_->Handle(&context, request, &response);
 
+        locationTimer_.start();
+        locationRefreshMs_ = kLocationRetryMs;
+
         if (status.ok() && response.has_get_location()) {
             const auto& loc = response.get_location();
             if (loc.has_lla()) {
+                locationRefreshMs_ = kLocationRefreshMs;
                 emit locationUpdated(loc.lla().lat(), loc.lla().lon(), loc.lla().alt());
             }
         }
@@ -105,4 +123,19 @@ void StarlinkClient::fetchStatus()
              emit speedUpdated(100.0f, 20.0f, 30.0f);
         }
     }
+
+    updatePollInterval(connected);
+}
+
+void StarlinkClient::updatePollInterval(bool connected)
+{
+    // Double the interval each poll the connection state stays the same, and
+    // snap back to the fastest rate as soon as it flips.
+    int interval = kMinPollIntervalMs;
+    if (lastConnected_ == connected)
+        interval = qMin(pollTimer_->interval() * 2, kMaxPollIntervalMs);
+    lastConnected_ = connected;
+
+    if (interval != pollTimer_->interval())
+        pollTimer_->setInterval(interval);
 }
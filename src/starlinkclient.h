@@ -4,7 +4,9 @@
 #include <QObject>
 #include <QString>
 #include <QTimer>
+#include <QElapsedTimer>
 #include <memory>
+#include <optional>
 #include <grpcpp/grpcpp.h>
 
 // Forward declarations for generated protobuf classes
@@ -40,8 +42,13 @@ private slots:
     void fetchStatus();
 
 private:
+    void updatePollInterval(bool connected);
+
     std::unique_ptr<SpaceX::API::Device::Device::Stub> stub_;
     QTimer *pollTimer_;
+    QElapsedTimer locationTimer_;
+    qint64 locationRefreshMs_ = 0;
+    std::optional<bool> lastConnected_;
     QString target_;
 };
 
@@ -51,7 +51,7 @@ class DeviceServicer(device_pb2_grpc.DeviceServicer):
         return response
 
 def serve():
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=os.cpu_count() or 8))
     device_pb2_grpc.add_DeviceServicer_to_server(DeviceServicer(), server)
     server.add_insecure_port('[::]:9200')
     print("Mock Starlink Dish running on port 9200...")